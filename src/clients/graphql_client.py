@@ -1,25 +1,68 @@
+from __future__ import annotations
+
+import contextlib
 import json
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import requests
 
+if TYPE_CHECKING:
+    from src.data.operation_catalog import Operation
+
 
 class GraphQLClient:
     def __init__(self, base_url: str, timeout: int = 30) -> None:
         self.base_url = base_url
         self.timeout = timeout
+        self.listeners: list[Callable[[str, dict | None, requests.Response, float, float], None]] = []
+        self.call_wrappers: list[Callable[[str], contextlib.AbstractContextManager]] = []
 
     def post(self, query: str, variables: dict | None = None) -> requests.Response:
+        response, _ = self.timed_post(query, variables)
+        return response
+
+    def timed_post(self, query: str, variables: dict | None = None) -> tuple[requests.Response, float]:
         payload = {"query": query}
         if variables is not None:
             payload["variables"] = variables
-        return requests.post(
+        return self._send(query, variables, json=payload)
+
+    def post_operation(self, operation: Operation, variables: dict | None = None) -> requests.Response:
+        if variables is None and operation.body is not None:
+            response, _ = self._send(operation.document, None, data=operation.body)
+            return response
+        return self.post(operation.document, variables)
+
+    def replay(self, body: bytes) -> float:
+        _, elapsed, _ = self._timed_post(data=body)
+        return elapsed
+
+    def _send(self, query: str, variables: dict | None, **body) -> tuple[requests.Response, float]:
+        with contextlib.ExitStack() as stack:
+            for wrapper in self.call_wrappers:
+                stack.enter_context(wrapper(query))
+            response, elapsed, cpu = self._timed_post(**body)
+        for listener in self.listeners:
+            listener(query, variables, response, elapsed, cpu)
+        return response, elapsed
+
+    def _timed_post(self, **body) -> tuple[requests.Response, float, float]:
+        # Resolved before timing so a lazily imported requests module loads outside the measured window.
+        send = requests.post
+        started_at = time.perf_counter()
+        cpu_started_at = time.thread_time()
+        response = send(
             self.base_url,
-            json=payload,
             headers={"Content-Type": "application/json"},
             timeout=self.timeout,
+            **body,
         )
+        cpu = time.thread_time() - cpu_started_at
+        elapsed = time.perf_counter() - started_at
+        return response, elapsed, cpu
 
     @staticmethod
     def parse_json(response: requests.Response) -> dict:
         return json.loads(response.text)
-
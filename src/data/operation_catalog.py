@@ -0,0 +1,173 @@
+import hashlib
+import json
+import re
+from collections.abc import Iterator
+
+from src.data.operations_contract import INVALID_TYPE_CASES, OPERATION_DOCUMENTS
+
+_TOKEN = re.compile(
+    r"""
+    (?P<ignored>[\s,\ufeff]+|\#[^\n\r]*)
+    | (?P<block_string>\"\"\"(?:\\\"\"\"|[^"]|"(?!""))*\"\"\")
+    | (?P<string>"(?:\\.|[^"\\\n\r])*")
+    | (?P<spread>\.\.\.)
+    | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<punctuator>[!$&():=@\[\]{|}])
+    """,
+    re.VERBOSE,
+)
+_WORD_TOKENS = frozenset({"name", "number"})
+OPERATION_TYPES = ("query", "mutation", "subscription")
+
+
+def tokenize(document: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    while position < len(document):
+        match = _TOKEN.match(document, position)
+        if match is None:
+            raise ValueError(f"Unexpected character {document[position]!r} at offset {position}")
+        if match.lastgroup != "ignored":
+            tokens.append((match.lastgroup, match.group()))
+        position = match.end()
+    return tokens
+
+
+def minify(tokens: list[tuple[str, str]]) -> str:
+    parts = []
+    previous_kind = None
+    for kind, value in tokens:
+        if previous_kind in _WORD_TOKENS and kind in _WORD_TOKENS:
+            parts.append(" ")
+        parts.append(value)
+        previous_kind = kind
+    return "".join(parts)
+
+
+def split_definitions(tokens: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    definitions = [[]]
+    brace_depth = 0
+    paren_depth = 0
+    for token in tokens:
+        definitions[-1].append(token)
+        value = token[1]
+        if value == "(":
+            paren_depth += 1
+        elif value == ")":
+            paren_depth -= 1
+        elif paren_depth:
+            continue
+        elif value == "{":
+            brace_depth += 1
+        elif value == "}":
+            brace_depth -= 1
+            if brace_depth == 0:
+                definitions.append([])
+    return [definition for definition in definitions if definition]
+
+
+def root_selection(tokens: list[tuple[str, str]]) -> tuple[str, tuple[str, ...]]:
+    operations = [definition for definition in split_definitions(tokens) if definition[0] != ("name", "fragment")]
+    if not operations:
+        return "query", ()
+    tokens = operations[0]
+    operation_type = tokens[0][1] if tokens[0][1] in OPERATION_TYPES else "query"
+    root_fields = []
+    # One entry per open selection set: True while it selects fields of the root type.
+    root_levels = []
+    paren_depth = 0
+    skipped_names = 0
+    inline_fragment = False
+    for index, (kind, value) in enumerate(tokens):
+        if value == "(":
+            paren_depth += 1
+        elif value == ")":
+            paren_depth -= 1
+        elif paren_depth:
+            continue
+        elif value == "{":
+            root_levels.append(not root_levels or (root_levels[-1] and inline_fragment))
+            inline_fragment = False
+        elif value == "}":
+            root_levels.pop()
+            if not root_levels:
+                break
+        elif not root_levels or not root_levels[-1]:
+            continue
+        elif value == "...":
+            inline_fragment = True
+            skipped_names = 1
+        elif value == "@":
+            skipped_names = 1
+        elif kind == "name":
+            if skipped_names:
+                skipped_names = 1 if value == "on" else skipped_names - 1
+                continue
+            inline_fragment = False
+            is_alias = index + 1 < len(tokens) and tokens[index + 1][1] == ":"
+            if not is_alias:
+                root_fields.append(value)
+    return operation_type, tuple(root_fields)
+
+
+class Operation:
+    def __init__(self, name: str, document: str) -> None:
+        tokens = tokenize(document)
+        self.name = name
+        self.document = minify(tokens)
+        self.digest = hashlib.sha256(self.document.encode("utf-8")).hexdigest()
+        self.operation_type, self.root_fields = root_selection(tokens)
+        self.has_variables = ("punctuator", "$") in tokens
+        self.body = None
+        if not self.has_variables:
+            self.body = json.dumps({"query": self.document}, separators=(",", ":")).encode("utf-8")
+
+    @property
+    def root_field(self) -> str | None:
+        return self.root_fields[0] if self.root_fields else None
+
+    def __repr__(self) -> str:
+        return f"Operation({self.name!r}, {self.operation_type} {self.root_field or '-'}, {self.digest[:12]})"
+
+
+class OperationCatalog:
+    def __init__(self, documents: dict[str, str] | None = None) -> None:
+        self.operations: dict[str, Operation] = {}
+        self.by_digest: dict[str, Operation] = {}
+        self.by_root_field: dict[str, list[Operation]] = {}
+        self._root_fields: dict[str, set[str]] = {operation_type: set() for operation_type in OPERATION_TYPES}
+        for name, document in (documents or {}).items():
+            self.add(name, document)
+
+    def add(self, name: str, document: str) -> Operation:
+        operation = Operation(name, document)
+        operation = self.by_digest.setdefault(operation.digest, operation)
+        self.operations[name] = operation
+        for root_field in operation.root_fields:
+            operations = self.by_root_field.setdefault(root_field, [])
+            if operation not in operations:
+                operations.append(operation)
+        self._root_fields[operation.operation_type].update(operation.root_fields)
+        return operation
+
+    def root_fields(self, operation_type: str | None = None) -> frozenset[str]:
+        if operation_type is not None:
+            return frozenset(self._root_fields[operation_type])
+        return frozenset().union(*self._root_fields.values())
+
+    def items(self):
+        return self.operations.items()
+
+    def __getitem__(self, name: str) -> Operation:
+        return self.operations[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.operations)
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+
+INVALID_TYPE_CATALOG = OperationCatalog(INVALID_TYPE_CASES)
+OPERATION_CATALOG = OperationCatalog(OPERATION_DOCUMENTS)
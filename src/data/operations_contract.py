@@ -76,3 +76,81 @@ INVALID_TYPE_CASES = {
     """,
 }
 
+
+OPERATION_DOCUMENTS = {
+    "typename": """
+        query {
+          __typename
+        }
+    """,
+    "mutation_result_enum": """
+        query {
+          __type(name: "MutationResult") {
+            kind
+            enumValues {
+              name
+            }
+          }
+        }
+    """,
+    "accounts_with_inactive": """
+        query {
+          accounts(withInactive: true) {
+            users { login }
+            paging { totalPagesCount currentPage pageSize }
+          }
+        }
+    """,
+    "accounts_without_with_inactive": """
+        query {
+          accounts {
+            paging { totalPagesCount }
+          }
+        }
+    """,
+    "account_current_with_unknown_argument": """
+        query {
+          accountCurrent(accessToken: "token", unknownArg: 1) {
+            resource { login }
+          }
+        }
+    """,
+    "account_current_without_selection_set": """
+        query {
+          accountCurrent(accessToken: "token")
+        }
+    """,
+    "unknown_query_field": """
+        query {
+          totallyUnknownField
+        }
+    """,
+    "activate_account_without_token": """
+        mutation {
+          activateAccount {
+            resource { login }
+          }
+        }
+    """,
+    "activate_account_with_invalid_uuid": """
+        mutation {
+          activateAccount(activationToken: "not-a-uuid") {
+            resource { login }
+          }
+        }
+    """,
+    "login_account_without_remember_me": """
+        mutation {
+          loginAccount(login: { login: "user", password: "pass" }) {
+            token
+          }
+        }
+    """,
+    "update_account_with_invalid_token": """
+        mutation {
+          updateAccount(accessToken: "invalid-token", userData: {name: "name"}) {
+            resource { login }
+          }
+        }
+    """,
+}
@@ -0,0 +1,149 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.clients.graphql_client import GraphQLClient
+from src.services.schema_service import fetch_schema, unwrap_type
+
+
+def run_on_targets(clients: dict[str, GraphQLClient], query: str, variables: dict | None = None) -> dict[str, dict]:
+    with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        futures = {name: pool.submit(_timed_post, client, query, variables) for name, client in clients.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def compare_operations(
+    clients: dict[str, GraphQLClient], operations: dict[str, str], rounds: int = 1
+) -> dict[str, dict[str, dict]]:
+    comparison = {}
+    for operation_name, query in operations.items():
+        results = run_on_targets(clients, query)
+        for result in results.values():
+            result["samples"] = []
+        for round_results in [results, *(run_on_targets(clients, query) for _ in range(rounds - 1))]:
+            for target, result in round_results.items():
+                if result["elapsed"] is not None:
+                    results[target]["samples"].append(result["elapsed"])
+        comparison[operation_name] = results
+    return comparison
+
+
+def _timed_post(client: GraphQLClient, query: str, variables: dict | None) -> dict:
+    # requests exceptions derive from OSError; importing requests here would defeat the lazy import in fast startup.
+    try:
+        response, elapsed = client.timed_post(query, variables)
+    except OSError as error:
+        return {"status_code": None, "body": None, "elapsed": None, "error": f"{type(error).__name__}: {error}"}
+    try:
+        body = client.parse_json(response)
+    except ValueError:
+        body = None
+    return {"status_code": response.status_code, "body": body, "elapsed": elapsed, "error": None}
+
+
+def error_shape(errors: list[dict] | None) -> list[dict] | None:
+    if not errors:
+        return None
+    shapes = [{"path": error.get("path"), "code": (error.get("extensions") or {}).get("code")} for error in errors]
+    return sorted(shapes, key=repr)
+
+
+def normalize_body(body: dict | None) -> dict | None:
+    if body is None:
+        return None
+    return {"data": body.get("data"), "errors": error_shape(body.get("errors"))}
+
+
+def diff_values(expected, actual, path: str = "$") -> list[str]:
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(expected.keys() | actual.keys()):
+            if key not in actual:
+                differences.append(f"{path}.{key}: missing")
+            elif key not in expected:
+                differences.append(f"{path}.{key}: unexpected")
+            else:
+                differences.extend(diff_values(expected[key], actual[key], f"{path}.{key}"))
+        return differences
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: length {len(expected)} != {len(actual)}"]
+        differences = []
+        for index, (expected_item, actual_item) in enumerate(zip(expected, actual, strict=True)):
+            differences.extend(diff_values(expected_item, actual_item, f"{path}[{index}]"))
+        return differences
+    if expected != actual:
+        return [f"{path}: {expected!r} != {actual!r}"]
+    return []
+
+
+def diff_results(results: dict[str, dict], baseline: str) -> dict[str, list[str]]:
+    expected = results[baseline]
+    differences = {}
+    for name, result in results.items():
+        if name == baseline:
+            continue
+        found = diff_values(expected["status_code"], result["status_code"], "status_code")
+        found.extend(diff_values(normalize_body(expected["body"]), normalize_body(result["body"])))
+        found.extend(
+            f"{target} error: {errored['error']}"
+            for target, errored in ((baseline, expected), (name, result))
+            if errored["error"]
+        )
+        differences[name] = found
+    return differences
+
+
+def collect_latencies(comparison: dict[str, dict[str, dict]]) -> dict[str, list[float]]:
+    return {
+        f"{operation_name} @ {target}": result["samples"]
+        for operation_name, results in comparison.items()
+        for target, result in results.items()
+        if result["samples"]
+    }
+
+
+def _normalize_type(type_node: dict) -> dict:
+    def named(items):
+        return {item["name"]: unwrap_type(item["type"]) for item in items or []}
+
+    return {
+        "kind": type_node["kind"],
+        "inputFields": named(type_node.get("inputFields")),
+        "fields": {
+            field["name"]: {"type": unwrap_type(field["type"]), "args": named(field["args"])}
+            for field in type_node.get("fields") or []
+        },
+    }
+
+
+def _schema_response(target: str, future: Future) -> dict:
+    try:
+        return future.result()
+    except OSError as error:
+        raise ValueError(f"Introspection failed on target {target}: {type(error).__name__}: {error}") from error
+
+
+def _schema_types(target: str, schema_response: dict) -> dict[str, dict]:
+    if schema_response.get("errors") or not (schema_response.get("data") or {}).get("__schema"):
+        raise ValueError(f"Introspection failed on target {target}: {schema_response.get('errors')}")
+    schema = schema_response["data"]["__schema"]
+    return {t["name"]: _normalize_type(t) for t in schema["types"] if t["name"]}
+
+
+def compare_schemas(clients: dict[str, GraphQLClient], baseline: str) -> dict[str, dict]:
+    with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        futures = {name: pool.submit(fetch_schema, client) for name, client in clients.items()}
+        schemas = {name: _schema_types(name, _schema_response(name, future)) for name, future in futures.items()}
+
+    expected = schemas[baseline]
+    differences = {}
+    for name, types in schemas.items():
+        if name == baseline:
+            continue
+        differences[name] = {
+            "missing": sorted(expected.keys() - types.keys()),
+            "extra": sorted(types.keys() - expected.keys()),
+            "changed": sorted(
+                type_name for type_name in expected.keys() & types.keys() if expected[type_name] != types[type_name]
+            ),
+        }
+    return differences
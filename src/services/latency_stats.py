@@ -0,0 +1,84 @@
+import math
+import random
+import statistics
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        raise ValueError("percentile() requires at least one sample")
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples: list[float]) -> dict:
+    return {
+        "count": len(samples),
+        "min": min(samples),
+        "p50": percentile(samples, 0.5),
+        "p90": percentile(samples, 0.9),
+        "p95": percentile(samples, 0.95),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def format_summary_table(summaries: dict[str, dict]) -> str:
+    columns = ("count", "min", "p50", "p90", "p95", "max", "mean")
+    name_width = max([len("target"), *(len(name) for name in summaries)]) + 2
+    lines = ["target".ljust(name_width) + "".join(column.rjust(10) for column in columns)]
+    for name, summary in summaries.items():
+        cells = [str(summary["count"]).rjust(10)]
+        cells.extend(f"{summary[column] * 1000:.1f}ms".rjust(10) for column in columns[1:])
+        lines.append(name.ljust(name_width) + "".join(cells))
+    return "\n".join(lines)
+
+
+def _ranks(values: list[float]) -> tuple[list[float], list[int]]:
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    tie_sizes = []
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        tie_sizes.append(end - start + 1)
+        start = end + 1
+    return ranks, tie_sizes
+
+
+def mann_whitney_greater(baseline: list[float], current: list[float]) -> float:
+    n_baseline, n_current = len(baseline), len(current)
+    total = n_baseline + n_current
+    ranks, tie_sizes = _ranks([*baseline, *current])
+    u_current = sum(ranks[n_baseline:]) - n_current * (n_current + 1) / 2
+    tie_correction = sum(size**3 - size for size in tie_sizes) / (total * (total - 1))
+    variance = n_baseline * n_current / 12 * ((total + 1) - tie_correction)
+    if variance <= 0:
+        return 1.0
+    z = (u_current - n_baseline * n_current / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_median_ratio_ci(
+    baseline: list[float],
+    current: list[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> tuple[float, float]:
+    rng = random.Random(seed)
+    ratios = sorted(
+        statistics.median(rng.choices(current, k=len(current)))
+        / statistics.median(rng.choices(baseline, k=len(baseline)))
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    return percentile(ratios, tail), percentile(ratios, 1 - tail)
@@ -1,61 +1,43 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from src.clients.graphql_client import GraphQLClient
 
-INTROSPECTION_QUERY = """
-query {
-  __schema {
-    queryType { name }
-    mutationType { name }
-    types {
+TYPE_REF_DEPTH = 8
+
+
+def _type_ref_fields(depth: int) -> str:
+    if depth == 0:
+        return "kind name"
+    return f"kind name ofType {{ {_type_ref_fields(depth - 1)} }}"
+
+
+TYPE_REF_FIELDS = _type_ref_fields(TYPE_REF_DEPTH)
+
+INTROSPECTION_QUERY = f"""
+query {{
+  __schema {{
+    queryType {{ name }}
+    mutationType {{ name }}
+    types {{
       name
       kind
-      inputFields {
+      inputFields {{
         name
-        type {
-          kind
-          name
-          ofType {
-            kind
-            name
-            ofType {
-              kind
-              name
-            }
-          }
-        }
-      }
-      fields(includeDeprecated: true) {
+        type {{ {TYPE_REF_FIELDS} }}
+      }}
+      fields(includeDeprecated: true) {{
         name
-        args {
-          name
-          type {
-            kind
-            name
-            ofType {
-              kind
-              name
-              ofType {
-                kind
-                name
-              }
-            }
-          }
-        }
-        type {
-          kind
+        args {{
           name
-          ofType {
-            kind
-            name
-            ofType {
-              kind
-              name
-            }
-          }
-        }
-      }
-    }
-  }
-}
+          type {{ {TYPE_REF_FIELDS} }}
+        }}
+        type {{ {TYPE_REF_FIELDS} }}
+      }}
+    }}
+  }}
+}}
 """
 
 
@@ -74,3 +56,124 @@ def unwrap_type(type_node: dict) -> str:
         return type_node["name"]
     of_type = type_node.get("ofType")
     return unwrap_type(of_type) if of_type else "Unknown"
+
+
+TYPE_FRAGMENT = f"""
+fragment TypeFields on __Type {{
+  name
+  kind
+  inputFields {{
+    name
+    type {{ {TYPE_REF_FIELDS} }}
+  }}
+  fields(includeDeprecated: true) {{
+    name
+    args {{
+      name
+      type {{ {TYPE_REF_FIELDS} }}
+    }}
+    type {{ {TYPE_REF_FIELDS} }}
+  }}
+  enumValues(includeDeprecated: true) {{
+    name
+  }}
+  interfaces {{
+    name
+  }}
+  possibleTypes {{
+    name
+  }}
+}}
+"""
+
+ROOT_TYPES_QUERY = "query { __schema { queryType { name } mutationType { name } } }"
+BUILT_IN_SCALARS = frozenset({"String", "Int", "Float", "Boolean", "ID"})
+
+
+def build_type_query(type_names: list[str]) -> str:
+    selections = "\n".join(
+        f"  t{index}: __type(name: {json.dumps(name)}) {{ ...TypeFields }}" for index, name in enumerate(type_names)
+    )
+    return f"query {{\n{selections}\n}}\n{TYPE_FRAGMENT}"
+
+
+def named_type(type_node: dict) -> str | None:
+    while type_node.get("name") is None and type_node.get("ofType"):
+        type_node = type_node["ofType"]
+    return type_node.get("name")
+
+
+def referenced_types(type_node: dict) -> set[str]:
+    references = set()
+    for input_field in type_node.get("inputFields") or []:
+        references.add(named_type(input_field["type"]))
+    for field in type_node.get("fields") or []:
+        references.add(named_type(field["type"]))
+        references.update(named_type(arg["type"]) for arg in field["args"])
+    for related in [*(type_node.get("interfaces") or []), *(type_node.get("possibleTypes") or [])]:
+        references.add(related["name"])
+    return references - BUILT_IN_SCALARS - {None}
+
+
+class SchemaModel:
+    def __init__(self) -> None:
+        self.types: dict[str, dict] = {}
+        self.missing: set[str] = set()
+
+    def merge(self, type_nodes: dict[str, dict | None]) -> None:
+        for name, type_node in type_nodes.items():
+            if type_node is None:
+                self.missing.add(name)
+            else:
+                self.types[name] = type_node
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.types or name in self.missing
+
+    def __getitem__(self, name: str) -> dict:
+        return self.types[name]
+
+
+class IntrospectionService:
+    def __init__(self, client: GraphQLClient, batch_size: int = 20, max_workers: int = 4) -> None:
+        self.client = client
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.model = SchemaModel()
+        self.requests_sent = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+
+    def fetch_root_types(self) -> dict:
+        return self._query(ROOT_TYPES_QUERY)["__schema"]
+
+    def fetch_types(self, type_names: list[str], depth: int = 0) -> SchemaModel:
+        pending = [name for name in dict.fromkeys(type_names) if name not in self.model]
+        for _ in range(depth + 1):
+            if not pending:
+                break
+            fetched = self._fetch_batches(pending)
+            self.model.merge(fetched)
+            references = set().union(*(referenced_types(node) for node in fetched.values() if node))
+            pending = sorted(name for name in references if name not in self.model)
+        return self.model
+
+    def _fetch_batches(self, type_names: list[str]) -> dict[str, dict | None]:
+        batches = [type_names[start : start + self.batch_size] for start in range(0, len(type_names), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            results = pool.map(self._fetch_batch, batches)
+            return {name: node for batch in results for name, node in batch.items()}
+
+    def _fetch_batch(self, type_names: list[str]) -> dict[str, dict | None]:
+        data = self._query(build_type_query(type_names))
+        return {name: data[f"t{index}"] for index, name in enumerate(type_names)}
+
+    def _query(self, query: str) -> dict:
+        response = self.client.post(query)
+        with self._lock:
+            self.requests_sent += 1
+            self.bytes_received += len(response.content)
+        body = self.client.parse_json(response)
+        if body.get("errors"):
+            raise ValueError(f"Introspection query failed: {body['errors']}")
+        return body["data"]
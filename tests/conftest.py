@@ -1,27 +1,67 @@
+from __future__ import annotations
+
 import os
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from dotenv import load_dotenv
 
 from src.clients.graphql_client import GraphQLClient
 
+if TYPE_CHECKING:
+    import requests
+
 ROOT = Path(__file__).resolve().parent.parent
 
+pytest_plugins = ["tests.plugins.perf_baseline", "tests.plugins.profiling"]
+
 
-load_dotenv()
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--run-benchmarks", action="store_true", help="Run tests marked benchmark")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("run_benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark, enable with --run-benchmarks")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(scope="session")
 def base_url() -> str:
+    load_dotenv()
     return os.getenv("BASE_URL")
 
 
+@pytest.fixture(scope="session")
+def http_session() -> Iterator[requests.Session]:
+    # Imported here: a module-level `import requests` would load it eagerly under tests.plugins.startup.
+    import requests
+
+    with requests.Session() as session:
+        yield session
+
+
 @pytest.fixture(scope="session")
 def gql(base_url: str) -> GraphQLClient:
     return GraphQLClient(base_url=base_url)
 
 
+@pytest.fixture(scope="session")
+def gql_targets(base_url: str) -> dict[str, GraphQLClient]:
+    targets = {}
+    for entry in filter(None, (item.strip() for item in os.getenv("BASE_URLS", "").split(","))):
+        name, separator, url = entry.partition("=")
+        if not separator:
+            name, url = entry, entry
+        targets[name.strip()] = GraphQLClient(base_url=url.strip())
+    return targets or {"baseline": GraphQLClient(base_url=base_url)}
+
+
 @pytest.fixture(scope="session")
 def schema_snapshot_path() -> Path:
     return ROOT / "schema.graphql"
@@ -0,0 +1,11 @@
+import pytest
+
+from src.clients.graphql_client import GraphQLClient
+
+
+def item_clients(item: pytest.Item) -> list[GraphQLClient]:
+    clients = {}
+    for value in getattr(item, "funcargs", {}).values():
+        candidates = value.values() if isinstance(value, dict) else [value]
+        clients.update((id(candidate), candidate) for candidate in candidates if isinstance(candidate, GraphQLClient))
+    return list(clients.values())
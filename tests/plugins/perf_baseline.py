@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.data.operation_catalog import Operation
+from src.services.latency_stats import bootstrap_median_ratio_ci, mann_whitney_greater
+from tests.plugins.clients import item_clients
+
+if TYPE_CHECKING:
+    import requests
+
+    from src.clients.graphql_client import GraphQLClient
+
+SAMPLES_KEY = pytest.StashKey[dict[tuple[str, str], list[float]]]()
+
+
+class PerformanceRegressionWarning(UserWarning):
+    pass
+
+
+class LatencyRecorder:
+    def __init__(self) -> None:
+        self.samples: dict[tuple[str, str], list[float]] = {}
+        self.replayable: dict[tuple[str, str], tuple[GraphQLClient, bytes]] = {}
+
+    def record(
+        self,
+        client: GraphQLClient,
+        query: str,
+        variables: dict | None,
+        response: requests.Response,
+        elapsed: float,
+        cpu: float,
+    ) -> None:
+        digest, is_query = _operation_identity(query)
+        key = (client.base_url, digest)
+        self.samples.setdefault(key, []).append(elapsed)
+        if is_query:
+            self.replayable.setdefault(key, (client, response.request.body))
+
+    def replay(self, repeat: int) -> None:
+        for key, (client, body) in self.replayable.items():
+            samples = self.samples[key]
+            while len(samples) < repeat:
+                samples.append(client.replay(body))
+
+
+@functools.lru_cache(maxsize=1024)
+def _operation_identity(query: str) -> tuple[str, bool]:
+    try:
+        operation = Operation("recorded", query)
+    except ValueError:
+        return hashlib.sha256(query.encode("utf-8")).hexdigest()[:12], False
+    return operation.digest[:12], operation.operation_type == "query"
+
+
+def _operation_key(item: pytest.Item) -> str:
+    callspec = getattr(item, "callspec", None)
+    if callspec is not None and "operation_name" in callspec.params:
+        return callspec.params["operation_name"]
+    return item.nodeid
+
+
+def _load_baseline(path: Path) -> dict[str, dict[str, list[float]]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("endpoints", {})
+
+
+def find_regression(config: pytest.Config, baseline: list[float], current: list[float]) -> str | None:
+    if len(baseline) < config.getoption("perf_min_baseline") or len(current) < config.getoption("perf_min_samples"):
+        return None
+    p_value = mann_whitney_greater(baseline, current)
+    low, high = bootstrap_median_ratio_ci(baseline, current)
+    if p_value >= config.getoption("perf_alpha") or low <= 1 + config.getoption("perf_min_effect"):
+        return None
+    return (
+        f"latency regressed: p={p_value:.4g} (Mann-Whitney U, n={len(baseline)}/{len(current)}), "
+        f"median ratio 95% CI [{low:.2f}, {high:.2f}]"
+    )
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("perf-baseline", "per-operation latency baselines")
+    group.addoption("--perf-baseline", default=".perf-baseline.json", help="Baseline store path under rootdir")
+    group.addoption("--perf-gate", choices=("off", "warn", "fail"), default="warn", help="Action on regression")
+    group.addoption("--perf-alpha", type=float, default=0.01, help="Significance level of the regression test")
+    group.addoption("--perf-min-effect", type=float, default=0.1, help="Minimal relative slowdown to report")
+    group.addoption("--perf-min-baseline", type=int, default=10, help="Baseline samples required before gating")
+    group.addoption("--perf-min-samples", type=int, default=3, help="Current samples required before gating")
+    group.addoption("--perf-repeat", type=int, default=1, help="Replay queries up to N samples (no mutations)")
+    group.addoption("--perf-history", type=int, default=200, help="Samples kept per operation in the store")
+    group.addoption("--perf-update", action="store_true", help="Write non-regressed samples back to the store")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("filterwarnings", "always::tests.plugins.perf_baseline.PerformanceRegressionWarning")
+    config.pluginmanager.register(PerfBaselinePlugin(config), "perf-baseline")
+
+
+class PerfBaselinePlugin:
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.path = config.rootpath / config.getoption("perf_baseline")
+        self.baseline = _load_baseline(self.path)
+        self.collected: dict[str, dict[str, list[float]]] = {}
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item):
+        recorder = LatencyRecorder()
+        clients = item_clients(item)
+        listeners = [functools.partial(recorder.record, client) for client in clients]
+        for client, listener in zip(clients, listeners, strict=True):
+            client.listeners.append(listener)
+        try:
+            result = yield
+        finally:
+            for client, listener in zip(clients, listeners, strict=True):
+                client.listeners.remove(listener)
+            item.stash[SAMPLES_KEY] = recorder.samples
+        recorder.replay(self.config.getoption("perf_repeat"))
+        return result
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo):
+        report = yield
+        samples = item.stash.get(SAMPLES_KEY, None)
+        if call.when != "call" or not samples or not report.passed:
+            return report
+
+        test_key = _operation_key(item)
+        gate = self.config.getoption("perf_gate")
+        regressions = []
+        for (endpoint, digest), operation_samples in samples.items():
+            key = f"{test_key}::{digest}"
+            baseline = self.baseline.get(endpoint, {}).get(key, [])
+            regression = None if gate == "off" else find_regression(self.config, baseline, operation_samples)
+            if regression is None:
+                report.user_properties.append(
+                    ("perf_samples", {"endpoint": endpoint, "key": key, "samples": operation_samples})
+                )
+            else:
+                regressions.append(f"{key} @ {endpoint}: {regression}")
+        if regressions and gate == "fail":
+            report.outcome = "failed"
+            report.longrepr = "\n".join(regressions)
+        for regression in regressions if gate == "warn" else []:
+            report.user_properties.append(("perf_regression", regression))
+            warnings.warn(PerformanceRegressionWarning(regression), stacklevel=1)
+        return report
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        for name, value in report.user_properties:
+            if name == "perf_samples":
+                operations = self.collected.setdefault(value["endpoint"], {})
+                operations.setdefault(value["key"], []).extend(value["samples"])
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if hasattr(self.config, "workerinput") or not self.config.getoption("perf_update") or not self.collected:
+            return
+        history = self.config.getoption("perf_history")
+        endpoints = {endpoint: dict(operations) for endpoint, operations in self.baseline.items()}
+        for endpoint, collected in self.collected.items():
+            operations = endpoints.setdefault(endpoint, {})
+            for key, samples in collected.items():
+                operations[key] = [*operations.get(key, []), *samples][-history:]
+        self.path.write_text(json.dumps({"endpoints": endpoints}, indent=2, sort_keys=True), encoding="utf-8")
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import allure
+import pytest
+
+from tests.plugins.clients import item_clients
+
+if TYPE_CHECKING:
+    import requests
+
+ALLOCATION_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen *>"))
+
+
+def _format_hotspots(profiler: cProfile.Profile, top: int) -> str:
+    hotspots = io.StringIO()
+    pstats.Stats(profiler, stream=hotspots).sort_stats("tottime").print_stats(top)
+    return hotspots.getvalue()
+
+
+def _format_allocations(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, top: int) -> str:
+    statistics = after.filter_traces(ALLOCATION_FILTERS).compare_to(before.filter_traces(ALLOCATION_FILTERS), "lineno")
+    return "\n".join(str(stat) for stat in statistics[:top])
+
+
+class CallProfiler:
+    def __init__(self, test_profiler: cProfile.Profile, top: int) -> None:
+        self.test_profiler = test_profiler
+        self.top = top
+        self.calls: list[tuple[str, float, float, str | None]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def profile(self, query: str):
+        self._local.profile = None
+        if not self._lock.acquire(blocking=False):
+            yield
+            return
+        profiler = cProfile.Profile()
+        traced_before, _ = tracemalloc.get_traced_memory()
+        self.test_profiler.disable()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self.test_profiler.enable()
+            traced_after, _ = tracemalloc.get_traced_memory()
+            self._lock.release()
+        self._local.profile = (
+            f"traced memory delta: {traced_after - traced_before:+d} B\n{_format_hotspots(profiler, self.top)}"
+        )
+
+    def record(
+        self, query: str, variables: dict | None, response: requests.Response, elapsed: float, cpu: float
+    ) -> None:
+        operation = " ".join(query.split())[:80]
+        self.calls.append((operation, elapsed, cpu, getattr(self._local, "profile", None)))
+
+    def format_summary(self) -> str:
+        lines = [f"{'wall':>10}{'cpu':>10}  operation"]
+        for operation, elapsed, cpu, _ in self.calls:
+            lines.append(f"{elapsed * 1000:8.1f}ms{cpu * 1000:8.1f}ms  {operation}")
+        total_cpu = sum(cpu for _, _, cpu, _ in self.calls)
+        lines.append(f"harness cpu per request: {total_cpu / len(self.calls) * 1000:.2f}ms")
+        return "\n".join(lines)
+
+    def format_profiles(self) -> str:
+        sections = []
+        for index, (operation, _, _, profile) in enumerate(self.calls, start=1):
+            body = profile or "not profiled: another client call was being profiled concurrently"
+            sections.append(f"=== call {index}: {operation}\n{body}")
+        return "\n".join(sections)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("profiling", "harness profiling")
+    group.addoption("--profile-harness", action="store_true", help="Profile tests and client calls with cProfile")
+    group.addoption("--profile-top", type=int, default=15, help="Hotspots and allocation sites attached per test")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("profile_harness"):
+        config.pluginmanager.register(ProfilingPlugin(config.getoption("profile_top")), "harness-profiling")
+
+
+class ProfilingPlugin:
+    def __init__(self, top: int) -> None:
+        self.top = top
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item):
+        profiler = cProfile.Profile()
+        call_profiler = CallProfiler(profiler, self.top)
+        clients = item_clients(item)
+        for client in clients:
+            client.listeners.append(call_profiler.record)
+            client.call_wrappers.append(call_profiler.profile)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        started_at = time.thread_time()
+        profiler.enable()
+        try:
+            return (yield)
+        finally:
+            profiler.disable()
+            cpu = time.thread_time() - started_at
+            after = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            for client in clients:
+                client.listeners.remove(call_profiler.record)
+                client.call_wrappers.remove(call_profiler.profile)
+            self._attach(profiler, before, after, call_profiler, cpu)
+
+    def _attach(self, profiler, before, after, call_profiler: CallProfiler, cpu: float) -> None:
+        allure.attach(
+            _format_hotspots(profiler, self.top),
+            name="cProfile hotspots (test body)",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        allure.attach(
+            _format_allocations(before, after, self.top),
+            name="tracemalloc allocation sites",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        summary = f"harness cpu: {cpu * 1000:.1f}ms"
+        if call_profiler.calls:
+            summary = f"{summary}\n{call_profiler.format_summary()}"
+            allure.attach(
+                call_profiler.format_profiles(),
+                name="client call profiles",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+        allure.attach(summary, name="client calls", attachment_type=allure.attachment_type.TEXT)
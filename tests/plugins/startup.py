@@ -0,0 +1,106 @@
+import importlib.abc
+import importlib.util
+import sys
+import time
+
+import pytest
+
+LAZY_MODULES = frozenset({"allure", "faker", "pydantic", "requests"})
+COLLECTION_TIME_KEY = pytest.StashKey[float]()
+COLLECTION_IMPORTS_KEY = pytest.StashKey[frozenset[str]]()
+REPORT_TOP = 15
+
+
+class ImportCostTracker(importlib.abc.MetaPathFinder):
+    def __init__(self, lazy_modules: frozenset[str]) -> None:
+        self.lazy_modules = lazy_modules
+        self.costs: dict[str, float] = {}
+        self.deferred: set[str] = set()
+        self._stack: list[list[float]] = []
+
+    def find_spec(self, fullname: str, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self)
+        if fullname in self.lazy_modules:
+            spec.loader = importlib.util.LazyLoader(spec.loader)
+            self.deferred.add(fullname)
+        return spec
+
+    def enter(self) -> None:
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def exit(self, name: str) -> None:
+        started_at, children = self._stack.pop()
+        total = time.perf_counter() - started_at
+        self.costs[name] = total - children
+        if self._stack:
+            self._stack[-1][1] += total
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader: importlib.abc.Loader, tracker: ImportCostTracker) -> None:
+        self.loader = loader
+        self.tracker = tracker
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self.tracker.enter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.tracker.exit(module.__name__)
+
+    def __getattr__(self, name: str):
+        return getattr(self.loader, name)
+
+
+def install_fast_startup() -> ImportCostTracker:
+    tracker = ImportCostTracker(LAZY_MODULES - sys.modules.keys())
+    sys.meta_path.insert(0, tracker)
+    return tracker
+
+
+TRACKER = install_fast_startup()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_collection(session: pytest.Session):
+    started_at = time.perf_counter()
+    try:
+        return (yield)
+    finally:
+        session.config.stash[COLLECTION_TIME_KEY] = time.perf_counter() - started_at
+        session.config.stash[COLLECTION_IMPORTS_KEY] = frozenset(TRACKER.costs)
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    terminalreporter.write_sep("-", "fast startup report")
+    collection_time = config.stash.get(COLLECTION_TIME_KEY, None)
+    if collection_time is not None:
+        terminalreporter.write_line(f"collection: {collection_time * 1000:.1f}ms")
+    not_loaded = sorted(TRACKER.lazy_modules - TRACKER.costs.keys())
+    loaded = TRACKER.deferred & TRACKER.costs.keys()
+    collection_imports = config.stash.get(COLLECTION_IMPORTS_KEY, frozenset())
+    preloaded = sorted(LAZY_MODULES - TRACKER.lazy_modules)
+    terminalreporter.write_line(f"not loaded: {', '.join(not_loaded) or '-'}")
+    terminalreporter.write_line(
+        f"loaded during startup and collection: {', '.join(sorted(loaded & collection_imports)) or '-'}"
+    )
+    terminalreporter.write_line(
+        f"loaded on first use in tests: {', '.join(sorted(loaded - collection_imports)) or '-'}"
+    )
+    terminalreporter.write_line(f"imported before the plugin: {', '.join(preloaded) or '-'}")
+    top = sorted(TRACKER.costs.items(), key=lambda item: item[1], reverse=True)[:REPORT_TOP]
+    for name, cost in top:
+        terminalreporter.write_line(f"{cost * 1000:9.1f}ms  {name}")
@@ -1,6 +1,8 @@
 import allure
 import pytest
 
+from src.data.operation_catalog import OPERATION_CATALOG
+
 pytestmark = pytest.mark.regression
 
 
@@ -25,16 +27,7 @@ def test_account_current_with_invalid_token_returns_error(gql):
 
 def test_accounts_with_inactive_true_returns_paging(gql):
     with allure.step("Query accounts list with withInactive=true"):
-        response = gql.post(
-            """
-            query {
-              accounts(withInactive: true) {
-                users { login }
-                paging { totalPagesCount currentPage pageSize }
-              }
-            }
-            """
-        )
+        response = gql.post_operation(OPERATION_CATALOG["accounts_with_inactive"])
     with allure.step("Verify accounts response contract"):
         assert response.status_code == 200
         body = gql.parse_json(response)
@@ -87,15 +80,7 @@ def test_logout_with_invalid_token_returns_error(gql):
 
 def test_update_account_with_invalid_token_returns_error(gql):
     with allure.step("Attempt updateAccount using invalid token"):
-        response = gql.post(
-            """
-            mutation {
-              updateAccount(accessToken: "invalid-token", userData: {name: "name"}) {
-                resource { login }
-              }
-            }
-            """
-        )
+        response = gql.post_operation(OPERATION_CATALOG["update_account_with_invalid_token"])
     with allure.step("Verify invalid token is rejected"):
         assert response.status_code in (200, 400)
         body = gql.parse_json(response)
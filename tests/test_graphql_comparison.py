@@ -0,0 +1,44 @@
+import allure
+import pytest
+
+from src.data.operations_contract import INVALID_TYPE_CASES
+from src.services.comparison_service import collect_latencies, compare_operations, compare_schemas, diff_results
+from src.services.latency_stats import format_summary_table, summarize
+
+pytestmark = pytest.mark.regression
+
+COMPARISON_ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def comparison_targets(gql_targets):
+    if len(gql_targets) < 2:
+        pytest.skip("Multi-target comparison requires at least two endpoints in BASE_URLS")
+    return gql_targets
+
+
+def test_targets_return_equivalent_responses(comparison_targets):
+    baseline = next(iter(comparison_targets))
+    operations = {"__typename": "query { __typename }", **INVALID_TYPE_CASES}
+    with allure.step(f"Execute {len(operations)} operations concurrently against {len(comparison_targets)} targets"):
+        comparison = compare_operations(comparison_targets, operations, rounds=COMPARISON_ROUNDS)
+    with allure.step("Attach per-operation latency distributions for every target"):
+        summaries = {name: summarize(samples) for name, samples in collect_latencies(comparison).items()}
+        allure.attach(format_summary_table(summaries), name="latency", attachment_type=allure.attachment_type.TEXT)
+    with allure.step(f"Verify normalized responses and error shapes match baseline target {baseline}"):
+        differences = {
+            f"{operation_name} @ {target}": found
+            for operation_name, results in comparison.items()
+            for target, found in diff_results(results, baseline).items()
+            if found
+        }
+        assert not differences, differences
+
+
+def test_targets_expose_identical_schemas(comparison_targets):
+    baseline = next(iter(comparison_targets))
+    with allure.step("Fetch introspection schemas from all targets concurrently"):
+        differences = compare_schemas(comparison_targets, baseline)
+    with allure.step(f"Verify every target schema matches baseline target {baseline}"):
+        drifted = {target: found for target, found in differences.items() if any(found.values())}
+        assert not drifted, drifted
@@ -4,7 +4,8 @@ import re
 import allure
 import pytest
 
-from src.services.schema_service import fetch_schema, unwrap_type
+from src.data.operation_catalog import OPERATION_CATALOG
+from src.services.schema_service import IntrospectionService, fetch_schema, unwrap_type
 
 pytestmark = pytest.mark.regression
 
@@ -142,7 +143,7 @@ def _parse_sdl_input_objects(sdl: str) -> dict[str, dict[str, str]]:
 @pytest.mark.smoke
 def test_graphql_smoke_typename(gql):
     with allure.step("Send __typename smoke query"):
-        response = gql.post("query { __typename }")
+        response = gql.post_operation(OPERATION_CATALOG["typename"])
     with allure.step("Verify successful response status"):
         assert response.status_code == 200
     with allure.step("Verify response data contains Query typename"):
@@ -167,18 +168,8 @@ def test_runtime_root_operations_match_snapshot(gql, schema_snapshot_path):
 
 
 def test_mutation_result_enum_contains_ok(gql):
-    query = """
-    query {
-      __type(name: "MutationResult") {
-        kind
-        enumValues {
-          name
-        }
-      }
-    }
-    """
     with allure.step("Send introspection query for MutationResult enum"):
-        response = gql.post(query)
+        response = gql.post_operation(OPERATION_CATALOG["mutation_result_enum"])
     with allure.step("Verify successful response status"):
         assert response.status_code == 200
     with allure.step("Verify MutationResult enum contains OK value"):
@@ -194,14 +185,11 @@ def test_input_object_fields_match_schema_snapshot(gql, schema_snapshot_path):
         assert snapshot is not None
         expected_inputs = _parse_sdl_input_objects(snapshot["sdl"])
         assert expected_inputs
-    with allure.step("Fetch runtime GraphQL schema for input object verification"):
-        runtime_data = fetch_schema(gql)
-        assert "errors" not in runtime_data
-        runtime_schema = runtime_data["data"]["__schema"]
-        runtime_types = {t["name"]: t for t in runtime_schema["types"] if t["name"]}
+    with allure.step("Fetch only the snapshot input object types via targeted introspection"):
+        runtime_types = IntrospectionService(gql).fetch_types(list(expected_inputs))
     with allure.step("Verify input field names and types are unchanged"):
         for input_name, expected_fields in expected_inputs.items():
-            assert input_name in runtime_types, input_name
+            assert input_name in runtime_types.types, input_name
             runtime_input_fields = runtime_types[input_name]["inputFields"] or []
             runtime_fields = {field["name"]: unwrap_type(field["type"]) for field in runtime_input_fields}
             assert runtime_fields == expected_fields, input_name
@@ -1,21 +1,20 @@
 import allure
 import pytest
-import requests
 
 pytestmark = pytest.mark.regression
 
 
 @pytest.mark.smoke
-def test_graphql_get_is_rejected(base_url):
+def test_graphql_get_is_rejected(base_url, http_session):
     with allure.step("Send GET request to GraphQL endpoint"):
-        response = requests.get(base_url, timeout=30)
+        response = http_session.get(base_url, timeout=30)
     with allure.step("Verify GET request is rejected"):
         assert response.status_code == 404
 
 
-def test_invalid_json_body_returns_error(base_url):
+def test_invalid_json_body_returns_error(base_url, http_session):
     with allure.step("Send POST request with invalid JSON body"):
-        response = requests.post(
+        response = http_session.post(
             base_url,
             data="{bad-json",
             headers={"Content-Type": "application/json"},
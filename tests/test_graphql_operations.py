@@ -1,19 +1,20 @@
 import allure
 import pytest
 
-from src.data.operations_contract import INVALID_TYPE_CASES
-from src.services.schema_service import fetch_schema
+from src.data.operation_catalog import INVALID_TYPE_CATALOG, OPERATION_CATALOG
+from src.services.schema_service import IntrospectionService
 
 pytestmark = pytest.mark.regression
 
 
 @pytest.mark.parametrize(
-    ("operation_name", "query"),
-    list(INVALID_TYPE_CASES.items()),
+    ("operation_name", "operation"),
+    list(INVALID_TYPE_CATALOG.items()),
+    ids=list(INVALID_TYPE_CATALOG),
 )
-def test_every_documented_operation_rejects_invalid_argument_types(gql, operation_name, query):
+def test_every_documented_operation_rejects_invalid_argument_types(gql, operation_name, operation):
     with allure.step(f"Execute operation {operation_name} with invalid argument types"):
-        response = gql.post(query)
+        response = gql.post_operation(operation)
     with allure.step(f"Verify operation {operation_name} returns validation error status"):
         assert response.status_code in (200, 400), operation_name
     with allure.step(f"Verify operation {operation_name} response contains GraphQL errors"):
@@ -23,15 +24,8 @@ def test_every_documented_operation_rejects_invalid_argument_types(gql, operatio
 
 
 def test_required_arguments_are_enforced(gql):
-    query = """
-    mutation {
-      activateAccount {
-        resource { login }
-      }
-    }
-    """
     with allure.step("Execute mutation without required activationToken argument"):
-        response = gql.post(query)
+        response = gql.post_operation(OPERATION_CATALOG["activate_account_without_token"])
     with allure.step("Verify response status indicates validation handling"):
         assert response.status_code in (200, 400)
     with allure.step("Verify missing required argument is reported in errors"):
@@ -41,31 +35,24 @@ def test_required_arguments_are_enforced(gql):
 
 
 def test_all_runtime_operations_have_coverage_cases(gql):
-    with allure.step("Fetch runtime GraphQL schema via introspection"):
-        runtime_data = fetch_schema(gql)
-        assert "errors" not in runtime_data
-        schema = runtime_data["data"]["__schema"]
+    with allure.step("Fetch runtime root types via targeted introspection"):
+        service = IntrospectionService(gql)
+        roots = service.fetch_root_types()
+        root_names = [roots["queryType"]["name"], roots["mutationType"]["name"]]
+        model = service.fetch_types(root_names)
+        assert not model.missing
     with allure.step("Collect runtime query and mutation operation names"):
-        types = {t["name"]: t for t in schema["types"]}
-        query_root = types[schema["queryType"]["name"]]
-        mutation_root = types[schema["mutationType"]["name"]]
-        runtime_operations = {field["name"] for field in (query_root["fields"] or [])}
-        runtime_operations.update({field["name"] for field in (mutation_root["fields"] or [])})
+        query_root, mutation_root = (model[name] for name in root_names)
+        runtime_queries = {field["name"] for field in (query_root["fields"] or [])}
+        runtime_mutations = {field["name"] for field in (mutation_root["fields"] or [])}
     with allure.step("Verify every runtime operation has a negative coverage case"):
-        assert runtime_operations == set(INVALID_TYPE_CASES.keys())
+        assert runtime_queries == INVALID_TYPE_CATALOG.root_fields("query")
+        assert runtime_mutations == INVALID_TYPE_CATALOG.root_fields("mutation")
 
 
 def test_accounts_requires_with_inactive_argument(gql):
     with allure.step("Execute accounts query without required withInactive argument"):
-        response = gql.post(
-            """
-            query {
-              accounts {
-                paging { totalPagesCount }
-              }
-            }
-            """
-        )
+        response = gql.post_operation(OPERATION_CATALOG["accounts_without_with_inactive"])
     with allure.step("Verify GraphQL reports missing required argument"):
         assert response.status_code in (200, 400)
         body = gql.parse_json(response)
@@ -75,15 +62,7 @@ def test_accounts_requires_with_inactive_argument(gql):
 
 def test_login_account_requires_remember_me(gql):
     with allure.step("Execute loginAccount mutation without required rememberMe field"):
-        response = gql.post(
-            """
-            mutation {
-              loginAccount(login: { login: "user", password: "pass" }) {
-                token
-              }
-            }
-            """
-        )
+        response = gql.post_operation(OPERATION_CATALOG["login_account_without_remember_me"])
     with allure.step("Verify GraphQL reports missing required rememberMe field"):
         assert response.status_code in (200, 400)
         body = gql.parse_json(response)
@@ -2,7 +2,8 @@ import time
 
 import allure
 import pytest
-import requests
+
+from src.data.operation_catalog import OPERATION_CATALOG
 
 pytestmark = pytest.mark.regression
 
@@ -17,7 +18,7 @@ def _assert_graphql_error_response(gql, response):
 @pytest.mark.smoke
 def test_post_valid_query_returns_json(gql):
     with allure.step("Send valid GraphQL POST query"):
-        response = gql.post("query { __typename }")
+        response = gql.post_operation(OPERATION_CATALOG["typename"])
     with allure.step("Verify successful HTTP status and GraphQL data payload"):
         assert response.status_code == 200
         body = gql.parse_json(response)
@@ -29,26 +30,26 @@ def test_post_valid_query_returns_json(gql):
 def test_smoke_query_response_time_under_sla(gql):
     with allure.step("Measure response time for smoke __typename query"):
         started_at = time.perf_counter()
-        response = gql.post("query { __typename }")
+        response = gql.post_operation(OPERATION_CATALOG["typename"])
         elapsed = time.perf_counter() - started_at
     with allure.step("Verify response is within SLA threshold"):
         assert response.status_code == 200
         assert elapsed < 15
 
 
-def test_missing_content_type_behavior_is_consistent(base_url):
+def test_missing_content_type_behavior_is_consistent(base_url, http_session):
     with allure.step("Send POST without Content-Type header"):
-        response = requests.post(base_url, data='{"query":"query { __typename }"}', timeout=30)
+        response = http_session.post(base_url, data='{"query":"query { __typename }"}', timeout=30)
     with allure.step("Verify API handles missing Content-Type without server error"):
         assert response.status_code in (200, 400, 404, 415)
         assert response.status_code < 500
 
 
-def test_large_payload_handling(base_url):
+def test_large_payload_handling(base_url, http_session):
     with allure.step("Send oversized but valid GraphQL request payload"):
         large_padding = " " * 200_000
         payload = {"query": f"query {{ __typename }}{large_padding}"}
-        response = requests.post(base_url, json=payload, timeout=30)
+        response = http_session.post(base_url, json=payload, timeout=30)
     with allure.step("Verify large payload does not cause server-side failure"):
         assert response.status_code in (200, 400, 413)
         assert response.status_code < 500
@@ -56,29 +57,21 @@ def test_large_payload_handling(base_url):
 
 def test_unknown_query_field_returns_error(gql):
     with allure.step("Send query with unknown root field"):
-        response = gql.post("query { totallyUnknownField }")
+        response = gql.post_operation(OPERATION_CATALOG["unknown_query_field"])
     with allure.step("Verify GraphQL validation error is returned"):
         _assert_graphql_error_response(gql, response)
 
 
 def test_unknown_argument_returns_error(gql):
     with allure.step("Send valid operation with unknown argument"):
-        response = gql.post(
-            """
-            query {
-              accountCurrent(accessToken: "token", unknownArg: 1) {
-                resource { login }
-              }
-            }
-            """
-        )
+        response = gql.post_operation(OPERATION_CATALOG["account_current_with_unknown_argument"])
     with allure.step("Verify GraphQL validation error is returned"):
         _assert_graphql_error_response(gql, response)
 
 
 def test_field_without_selection_set_returns_error(gql):
     with allure.step("Send query for object-returning field without selection set"):
-        response = gql.post('query { accountCurrent(accessToken: "token") }')
+        response = gql.post_operation(OPERATION_CATALOG["account_current_without_selection_set"])
     with allure.step("Verify selection-set validation error is returned"):
         _assert_graphql_error_response(gql, response)
 
@@ -118,14 +111,6 @@ def test_missing_declared_variable_returns_error(gql):
 
 def test_invalid_uuid_format_returns_error(gql):
     with allure.step("Send mutation with invalid UUID format"):
-        response = gql.post(
-            """
-            mutation {
-              activateAccount(activationToken: "not-a-uuid") {
-                resource { login }
-              }
-            }
-            """
-        )
+        response = gql.post_operation(OPERATION_CATALOG["activate_account_with_invalid_uuid"])
     with allure.step("Verify UUID validation error is returned"):
         _assert_graphql_error_response(gql, response)
@@ -0,0 +1,61 @@
+import statistics
+import time
+
+import allure
+import pytest
+
+from src.clients.graphql_client import GraphQLClient
+from src.services.latency_stats import format_summary_table, summarize
+from src.services.schema_service import INTROSPECTION_QUERY, IntrospectionService
+
+pytestmark = pytest.mark.benchmark
+
+BENCHMARK_SAMPLES = 7
+BENCHMARK_DEPTH = 2
+
+
+@pytest.fixture(scope="module")
+def benchmark_client(base_url: str) -> GraphQLClient:
+    # Not the shared gql fixture, so harness listeners, call wrappers and replays stay out of the measurements.
+    return GraphQLClient(base_url=base_url)
+
+
+def _measure(fetch) -> tuple[float, int]:
+    started_at = time.perf_counter()
+    transferred = fetch()
+    return time.perf_counter() - started_at, transferred
+
+
+def _fetch_full_schema(client: GraphQLClient) -> int:
+    response = client.post(INTROSPECTION_QUERY)
+    assert "errors" not in client.parse_json(response)
+    return len(response.content)
+
+
+def _fetch_mutation_types(client: GraphQLClient, mutation_root: str) -> int:
+    service = IntrospectionService(client)
+    model = service.fetch_types([mutation_root], depth=BENCHMARK_DEPTH)
+    assert not model.missing
+    return service.bytes_received
+
+
+def test_targeted_introspection_is_cheaper_than_full_schema(benchmark_client):
+    with allure.step("Resolve the mutation root type name"):
+        mutation_root = IntrospectionService(benchmark_client).fetch_root_types()["mutationType"]["name"]
+    benchmarks = {
+        "full": lambda: _fetch_full_schema(benchmark_client),
+        f"targeted depth={BENCHMARK_DEPTH}": lambda: _fetch_mutation_types(benchmark_client, mutation_root),
+    }
+    with allure.step(f"Warm up and take {BENCHMARK_SAMPLES} samples of full and targeted introspection"):
+        samples = {}
+        for name, fetch in benchmarks.items():
+            fetch()
+            samples[name] = [_measure(fetch) for _ in range(BENCHMARK_SAMPLES)]
+    with allure.step("Attach median latency and payload size comparison"):
+        summaries = {name: summarize([elapsed for elapsed, _ in measured]) for name, measured in samples.items()}
+        sizes = {name: statistics.median(size for _, size in measured) for name, measured in samples.items()}
+        table = format_summary_table(summaries)
+        table += "\n" + "\n".join(f"{name}: median {size:.0f} bytes" for name, size in sizes.items())
+        allure.attach(table, name="introspection benchmark", attachment_type=allure.attachment_type.TEXT)
+    with allure.step("Verify targeted introspection transfers fewer bytes"):
+        assert sizes[f"targeted depth={BENCHMARK_DEPTH}"] < sizes["full"]
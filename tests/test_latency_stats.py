@@ -0,0 +1,48 @@
+import pytest
+
+from src.services.latency_stats import bootstrap_median_ratio_ci, mann_whitney_greater, percentile, summarize
+
+BASELINE = [0.100, 0.104, 0.098, 0.110, 0.101, 0.097, 0.105, 0.099, 0.103, 0.108, 0.102, 0.100]
+
+
+def test_percentile_interpolates_between_samples():
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.5
+    assert percentile([5.0], 0.95) == 5.0
+    assert summarize([3.0, 1.0, 2.0])["p50"] == 2.0
+
+
+def test_percentile_rejects_empty_samples():
+    with pytest.raises(ValueError):
+        percentile([], 0.5)
+
+
+def test_mann_whitney_returns_one_for_identical_constant_samples():
+    assert mann_whitney_greater([0.1] * 10, [0.1] * 5) == 1.0
+
+
+def test_mann_whitney_does_not_flag_same_distribution():
+    assert mann_whitney_greater(BASELINE, BASELINE[:6]) > 0.3
+
+
+def test_mann_whitney_flags_clearly_shifted_samples():
+    assert mann_whitney_greater(BASELINE, [sample * 1.5 for sample in BASELINE[:5]]) < 0.001
+
+
+def test_mann_whitney_is_one_sided():
+    assert mann_whitney_greater(BASELINE, [sample * 0.5 for sample in BASELINE[:5]]) > 0.99
+
+
+def test_mann_whitney_handles_ties_between_groups():
+    assert mann_whitney_greater([1.0, 1.0, 2.0, 2.0], [2.0, 2.0, 3.0, 3.0]) == pytest.approx(0.0432, abs=1e-4)
+
+
+def test_bootstrap_ratio_ci_covers_true_shift():
+    low, high = bootstrap_median_ratio_ci(BASELINE, [sample * 2 for sample in BASELINE])
+    assert low <= 2.0 <= high
+    assert low > 1.8
+
+
+def test_bootstrap_ratio_ci_is_deterministic_and_contains_one_without_shift():
+    interval = bootstrap_median_ratio_ci(BASELINE, BASELINE)
+    assert interval == bootstrap_median_ratio_ci(BASELINE, BASELINE)
+    assert interval[0] <= 1.0 <= interval[1]
@@ -0,0 +1,71 @@
+import pytest
+
+from src.data.operation_catalog import Operation, OperationCatalog, minify, root_selection, split_definitions, tokenize
+
+
+def test_tokenize_drops_whitespace_commas_comments_and_bom():
+    tokens = tokenize('\ufeffquery { # comment\n  a(x: 1, y: "b, c") }')
+    assert tokens == [
+        ("name", "query"),
+        ("punctuator", "{"),
+        ("name", "a"),
+        ("punctuator", "("),
+        ("name", "x"),
+        ("punctuator", ":"),
+        ("number", "1"),
+        ("name", "y"),
+        ("punctuator", ":"),
+        ("string", '"b, c"'),
+        ("punctuator", ")"),
+        ("punctuator", "}"),
+    ]
+
+
+def test_tokenize_rejects_unexpected_characters():
+    with pytest.raises(ValueError, match="offset 8"):
+        tokenize("query { ? }")
+
+
+def test_minify_separates_only_adjacent_words():
+    assert minify(tokenize('query Q($id: ID = 1) {\n  a(id: $id, s: "x  y") { b c }\n}')) == (
+        'query Q($id:ID=1){a(id:$id s:"x  y"){b c}}'
+    )
+
+
+def test_split_definitions_ignores_braces_inside_arguments():
+    definitions = split_definitions(tokenize("query Q($a: In = {b: 1}) { x } fragment F on T { y }"))
+    assert [minify(definition) for definition in definitions] == ["query Q($a:In={b:1}){x}", "fragment F on T{y}"]
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    [
+        ("{ a b }", ("query", ("a", "b"))),
+        ("mutation M { m(input: {a: 1}) { ok } }", ("mutation", ("m",))),
+        ("query Q($a: In = {b: 1}) { x y }", ("query", ("x", "y"))),
+        ("query { alias: a { b } c @skip(if: true) }", ("query", ("a", "c"))),
+        ("query { ... @include(if: true) { x } y }", ("query", ("x", "y"))),
+        ("query { ... on Query { x { z } } ...F y }", ("query", ("x", "y"))),
+        ('query { a(s: "}") { ... { b } } c }', ("query", ("a", "c"))),
+        ("fragment F on Query { q } mutation { m }", ("mutation", ("m",))),
+        ("fragment F on Query { q }", ("query", ())),
+        ("query { }", ("query", ())),
+    ],
+)
+def test_root_selection(document, expected):
+    assert root_selection(tokenize(document)) == expected
+
+
+def test_operation_digest_ignores_formatting_and_variable_free_body_is_pre_encoded():
+    operation = Operation("typename", "query {\n  __typename\n}")
+    assert operation.digest == Operation("other", "query{__typename}").digest
+    assert operation.body == b'{"query":"query{__typename}"}'
+    assert Operation("with_variables", "query($id: ID) { a(id: $id) }").body is None
+
+
+def test_catalog_deduplicates_operations_by_digest():
+    catalog = OperationCatalog({"first": "{ a }", "second": "query { a }", "third": "{ a }"})
+    assert catalog["first"] is catalog["third"]
+    assert catalog["first"] is not catalog["second"]
+    assert catalog.by_root_field["a"] == [catalog["first"], catalog["second"]]
+    assert catalog.root_fields("query") == {"a"}
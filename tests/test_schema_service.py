@@ -0,0 +1,110 @@
+import json
+import re
+from types import SimpleNamespace
+
+from src.clients.graphql_client import GraphQLClient
+from src.services.schema_service import (
+    INTROSPECTION_QUERY,
+    ROOT_TYPES_QUERY,
+    TYPE_REF_DEPTH,
+    TYPE_REF_FIELDS,
+    IntrospectionService,
+    named_type,
+)
+
+LARGE_SCHEMA_TYPES = 2000
+TYPE_SELECTION = re.compile(r'(t\d+): __type\(name: ("[^"]*")\)')
+
+
+def _ref(name: str, kind: str = "OBJECT", *wrappers: str) -> dict:
+    type_ref = {"kind": kind, "name": name, "ofType": None}
+    for wrapper in reversed(wrappers):
+        type_ref = {"kind": wrapper, "name": None, "ofType": type_ref}
+    return type_ref
+
+
+def _type(name: str, kind: str = "OBJECT", fields=(), interfaces=(), possible_types=()) -> dict:
+    return {
+        "name": name,
+        "kind": kind,
+        "inputFields": None,
+        "fields": [{"name": field, "args": [], "type": type_ref} for field, type_ref in fields] or None,
+        "enumValues": None,
+        "interfaces": [{"name": interface} for interface in interfaces],
+        "possibleTypes": [{"name": possible_type} for possible_type in possible_types] or None,
+    }
+
+
+class SchemaServer:
+    def __init__(self, types: list[dict]) -> None:
+        self.types = {type_node["name"]: type_node for type_node in types}
+
+    def post(self, query: str, variables: dict | None = None) -> SimpleNamespace:
+        schema = {"queryType": {"name": "Query"}, "mutationType": None}
+        if query == INTROSPECTION_QUERY:
+            data = {"__schema": {**schema, "types": list(self.types.values())}}
+        elif query == ROOT_TYPES_QUERY:
+            data = {"__schema": schema}
+        else:
+            data = {alias: self.types.get(json.loads(name)) for alias, name in TYPE_SELECTION.findall(query)}
+        content = json.dumps({"data": data}).encode("utf-8")
+        return SimpleNamespace(content=content, text=content.decode("utf-8"))
+
+    parse_json = staticmethod(GraphQLClient.parse_json)
+
+
+def _large_schema() -> SchemaServer:
+    entities = [
+        _type(
+            f"Entity{index}",
+            fields=[("id", _ref("ID", "SCALAR", "NON_NULL")), ("next", _ref(f"Entity{index + 1}"))],
+        )
+        for index in range(LARGE_SCHEMA_TYPES)
+    ]
+    return SchemaServer([_type("Query", fields=[("entity", _ref("Entity0"))]), *entities])
+
+
+def test_type_ref_fields_reach_the_configured_depth():
+    assert TYPE_REF_FIELDS.count("ofType") == TYPE_REF_DEPTH
+    assert named_type(_ref("B", "OBJECT", "NON_NULL", "LIST", "NON_NULL", "LIST", "NON_NULL", "LIST")) == "B"
+
+
+def test_targeted_fetch_of_large_schema_transfers_a_fraction_of_full_introspection():
+    server = _large_schema()
+    full_bytes = len(server.post(INTROSPECTION_QUERY).content)
+    service = IntrospectionService(server)
+    model = service.fetch_types(["Query"], depth=2)
+    assert set(model.types) == {"Query", "Entity0", "Entity1"}
+    assert service.requests_sent == 3
+    assert service.bytes_received * 100 < full_bytes
+
+
+def test_fetch_types_follows_wrapped_unions_and_interfaces():
+    server = SchemaServer(
+        [
+            _type(
+                "Query",
+                fields=[
+                    ("search", _ref("Result", "UNION", "NON_NULL", "LIST", "NON_NULL", "LIST", "NON_NULL", "LIST")),
+                    ("node", _ref("Node", "INTERFACE")),
+                ],
+            ),
+            _type("Result", "UNION", possible_types=["A", "B"]),
+            _type("Node", "INTERFACE", fields=[("id", _ref("ID", "SCALAR"))], possible_types=["A"]),
+            _type("A", fields=[("id", _ref("ID", "SCALAR"))], interfaces=["Node"]),
+            _type("B", fields=[("c", _ref("C"))]),
+            _type("C"),
+        ]
+    )
+    model = IntrospectionService(server).fetch_types(["Query"], depth=2)
+    assert set(model.types) == {"Query", "Result", "Node", "A", "B"}
+    assert not model.missing
+
+
+def test_fetch_types_batches_requests_and_records_missing_types():
+    service = IntrospectionService(_large_schema(), batch_size=2)
+    model = service.fetch_types(["Entity0", "Entity1", "Entity2", "Unknown"])
+    assert service.requests_sent == 2
+    assert model.missing == {"Unknown"}
+    assert "Unknown" in model
+    assert model["Entity2"]["fields"][1]["type"]["name"] == "Entity3"